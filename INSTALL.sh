@@ -43,6 +43,7 @@ mkdir -p "${PLUGIN_DIR}/rulesets"
 mkdir -p "${PLUGIN_DIR}/server_side_calls"
 mkdir -p "${PLUGIN_DIR}/agent_based"
 mkdir -p "${PLUGIN_DIR}/graphing"
+mkdir -p "${PLUGIN_DIR}/lib"
 
 # Copy files
 echo "Installing plugin files..."
@@ -52,7 +53,7 @@ cp -v cmk_addons/plugins/storagegrid/libexec/agent_storagegrid "${PLUGIN_DIR}/li
 chmod +x "${PLUGIN_DIR}/libexec/agent_storagegrid"
 
 # Rulesets (GUI configuration)
-cp -v cmk_addons/plugins/storagegrid/rulesets/special_agent.py "${PLUGIN_DIR}/rulesets/"
+cp -v cmk_addons/plugins/storagegrid/rulesets/*.py "${PLUGIN_DIR}/rulesets/"
 
 # Server-side calls (agent invocation)
 cp -v cmk_addons/plugins/storagegrid/server_side_calls/special_agent.py "${PLUGIN_DIR}/server_side_calls/"
@@ -63,6 +64,9 @@ cp -v cmk_addons/plugins/storagegrid/agent_based/*.py "${PLUGIN_DIR}/agent_based
 # Graph templates
 cp -v cmk_addons/plugins/storagegrid/graphing/*.py "${PLUGIN_DIR}/graphing/"
 
+# Helpers shared by the check plugins
+cp -v cmk_addons/plugins/storagegrid/lib/*.py "${PLUGIN_DIR}/lib/"
+
 # Python package __init__.py files (required for module discovery)
 echo "Installing Python package files..."
 cp -v cmk_addons/__init__.py "${OMD_ROOT}/local/lib/python3/cmk_addons/"
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for the StorageGRID special agent
+
+Starts the mock API server from mock_storagegrid.py for each grid size, runs
+agent_storagegrid against it and reports wall time, API requests and peak
+memory (maximum resident set size) of the agent process. Needs requests and
+the openssl CLI, but no CheckMK site:
+
+    python3 benchmarks/bench_agent.py --sizes 10x50 100x1000 500x10000 --latency-ms 20
+
+Arguments after "--" are passed to the agent, for example
+"-- --max-workers 8 --no-query-batching" to compare settings.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+AGENT = os.path.join(BENCH_DIR, "..", "cmk_addons", "plugins", "storagegrid", "libexec", "agent_storagegrid")
+
+sys.path.insert(0, BENCH_DIR)
+
+# pylint: disable=wrong-import-position
+from mock_storagegrid import SyntheticGrid, create_server  # noqa: E402
+
+# Runs the agent and writes its peak RSS (VmHWM, KiB) to the file named by
+# BENCH_PEAK_RSS_FILE. ru_maxrss from wait4() is no use here: it also counts the
+# child before exec, a copy of this process with the whole mock grid in memory.
+PEAK_RSS_LAUNCHER = """
+import atexit, os, runpy, sys
+
+def report():
+    with open('/proc/self/status') as status:
+        peak = next(line.split()[1] for line in status if line.startswith('VmHWM:'))
+    with open(os.environ['BENCH_PEAK_RSS_FILE'], 'w') as f:
+        f.write(peak)
+
+atexit.register(report)
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+"""
+
+
+def parse_size(value):
+    """Parse a NODESxTENANTS grid size"""
+    try:
+        nodes, tenants = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NODESxTENANTS, got {value!r}")
+    return nodes, tenants
+
+
+def run_agent(port, agent_args, workdir):
+    """Run the agent once, returning (seconds, exit code, peak RSS in KiB, output)"""
+    output_path = os.path.join(workdir, "agent.out")
+    peak_rss_path = os.path.join(workdir, "agent.peak_rss")
+    command = [
+        sys.executable, "-c", PEAK_RSS_LAUNCHER, AGENT,
+        "--hostname", f"127.0.0.1:{port}",
+        "--username", "root",
+        "--password", "mock",
+        "--no-cert-check",
+    ] + agent_args
+    with open(output_path, "wb") as output:
+        start = time.perf_counter()
+        process = subprocess.run(command, stdout=output, stderr=subprocess.DEVNULL,
+                                 env=dict(os.environ, BENCH_PEAK_RSS_FILE=peak_rss_path))
+        seconds = time.perf_counter() - start
+    with open(peak_rss_path, encoding="utf-8") as peak_rss:
+        max_rss = int(peak_rss.read())
+    with open(output_path, encoding="utf-8") as output:
+        return seconds, process.returncode, max_rss, output.read()
+
+
+def failed_sections(agent_output):
+    """Names of the sections that report an error"""
+    failed = []
+    lines = agent_output.splitlines()
+    for header, payload in zip(lines, lines[1:]):
+        if not header.startswith("<<<"):
+            continue
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            data = {"error": "unparsable"}
+        if isinstance(data, dict) and "error" in data:
+            failed.append(header[3:].split(":", 1)[0].split(">", 1)[0])
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[(10, 50), (100, 1000), (500, 10000)],
+                        help="Grid sizes as NODESxTENANTS")
+    parser.add_argument("--sites", type=int, default=2)
+    parser.add_argument("--alerts", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0,
+                        help="Delay added by the mock to every API response")
+    parser.add_argument("--bulk-tenant-coverage", type=float, default=1.0,
+                        help="Fraction of tenants served by the tenant usage metrics")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of API GET requests the mock answers with HTTP 503")
+    parser.add_argument("--compress", action="store_true",
+                        help="Let the mock compress responses the agent accepts compressed")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Agent runs per grid size, the fastest is reported")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("agent_args", nargs=argparse.REMAINDER,
+                        help="Arguments passed to the agent after --")
+    args = parser.parse_args()
+    agent_args = args.agent_args[1:] if args.agent_args[:1] == ["--"] else args.agent_args
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_agent_") as workdir:
+        for nodes, tenants in args.sizes:
+            grid = SyntheticGrid(args.sites, nodes, tenants, args.alerts,
+                                 bulk_tenant_coverage=args.bulk_tenant_coverage)
+            server = create_server(grid, latency=args.latency_ms / 1000, certdir=workdir,
+                                   error_rate=args.error_rate, compress=args.compress)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                runs = []
+                for _ in range(args.repeat):
+                    with server.lock:
+                        server.stats = {"requests": 0, "endpoints": {}}
+                    seconds, exit_code, max_rss, output = run_agent(
+                        server.server_address[1], agent_args, workdir
+                    )
+                    with server.lock:
+                        requests = server.stats["requests"]
+                    runs.append({
+                        "nodes": nodes,
+                        "tenants": tenants,
+                        "seconds": round(seconds, 3),
+                        "requests": requests,
+                        "peak_rss_mib": round(max_rss / 1024, 1),
+                        "exit_code": exit_code,
+                        "failed_sections": failed_sections(output),
+                    })
+            finally:
+                server.shutdown()
+                server.server_close()
+            results.append(min(runs, key=lambda run: run["seconds"]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'nodes':>7}{'tenants':>9}{'wall time (s)':>15}{'requests':>10}{'peak RSS (MiB)':>16}  errors")
+    for run in results:
+        errors = ", ".join(run["failed_sections"]) or (f"exit code {run['exit_code']}" if run["exit_code"] else "-")
+        print(f"{run['nodes']:>7}{run['tenants']:>9}{run['seconds']:>15.2f}{run['requests']:>10}"
+              f"{run['peak_rss_mib']:>16.1f}  {errors}")
+
+
+if __name__ == "__main__":
+    main()
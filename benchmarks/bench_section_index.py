@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for item lookups in the StorageGRID check plugins
+
+Times one full check cycle (parse the section once, then check every
+discovered item) with the indexed parse functions, and compares it with the
+per-item linear scan the check functions used before. Must run inside a
+CheckMK site so that cmk.agent_based is importable:
+
+    su - <your_site_name>
+    python3 benchmarks/bench_section_index.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from cmk_addons.plugins.storagegrid.agent_based import (  # noqa: E402
+    storagegrid_health,
+    storagegrid_resources,
+    storagegrid_s3,
+    storagegrid_tenants,
+)
+
+
+def tenant_section(count):
+    return {
+        "timestamp": "2026-01-01T00:00:00",
+        "tenants": [
+            {
+                "account_id": f"{i:020d}",
+                "account_name": f"tenant-{i:05d}",
+                "data_bytes": i * 1024 ** 3,
+                "object_count": i * 1000,
+                "quota_bytes": 10 * 1024 ** 4,
+                "quota_percent": (i * 1024 ** 3) / (10 * 1024 ** 4) * 100,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def health_section(count, sites=4):
+    return {
+        "timestamp": "2026-01-01T00:00:00",
+        "sites": [
+            {
+                "name": f"Site{s}",
+                "id": f"site-{s}",
+                "state": "connected",
+                "nodes": [
+                    {
+                        "id": f"node-{i:05d}",
+                        "name": f"SN{i:05d}",
+                        "type": "storageNode",
+                        "state": "connected",
+                        "severity": "normal",
+                    }
+                    for i in range(s, count, sites)
+                ],
+            }
+            for s in range(sites)
+        ],
+    }
+
+
+def resources_section(count):
+    return {
+        "timestamp": "2026-01-01T00:00:00",
+        "nodes": [
+            {"node": f"SN{i:05d}", "cpu_percent": 12.5, "memory_bytes": 8 * 1024 ** 3}
+            for i in range(count)
+        ],
+    }
+
+
+def s3_node_section(count, sites=4):
+    return {
+        "timestamp": "2026-01-01T00:00:00",
+        "nodes": [
+            {
+                "node": f"SN{i:05d}",
+                "site": f"Site{i % sites}",
+                "successful_rate": 250.0,
+                "failed_rate": 1.5,
+                "bytes_in_rate": 64 * 1024 ** 2,
+                "bytes_out_rate": 96 * 1024 ** 2,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def linear_tenant(section, item):
+    return next(t for t in section["tenants"] if t.get("account_name") == item)
+
+
+def linear_node(section, item):
+    site_name, node_name = item.split("/", 1)
+    for site in section["sites"]:
+        if site["name"] == site_name:
+            for node in site["nodes"]:
+                if node["name"] == node_name:
+                    return node
+    return None
+
+
+def linear_resource(section, item):
+    return next(n for n in section["nodes"] if n.get("node") == item)
+
+
+def linear_s3_node(section, item):
+    return next(n for n in section["nodes"] if n.get("node") == item)
+
+
+# name, section factory, parse, discover, check, check params, linear lookup
+CASES = [
+    (
+        "tenant_usage",
+        tenant_section,
+        storagegrid_tenants.parse_storagegrid_tenant_usage,
+        storagegrid_tenants.discover_storagegrid_tenant_usage,
+        storagegrid_tenants.check_storagegrid_tenant_usage,
+        {"quota_levels": (80.0, 90.0)},
+        linear_tenant,
+    ),
+    (
+        "nodes",
+        health_section,
+        storagegrid_health.parse_storagegrid_health,
+        storagegrid_health.discover_storagegrid_nodes,
+        storagegrid_health.check_storagegrid_node,
+        None,
+        linear_node,
+    ),
+    (
+        "node_resources",
+        resources_section,
+        storagegrid_resources.parse_storagegrid_resources,
+        storagegrid_resources.discover_storagegrid_node_resources,
+        storagegrid_resources.check_storagegrid_node_resources,
+        {"cpu_levels": (80.0, 90.0)},
+        linear_resource,
+    ),
+    (
+        "s3_nodes",
+        s3_node_section,
+        storagegrid_s3.parse_storagegrid_s3_nodes,
+        storagegrid_s3.discover_storagegrid_s3_node,
+        storagegrid_s3.check_storagegrid_s3_node,
+        {"error_rate_levels": ("fixed", (1.0, 5.0))},
+        linear_s3_node,
+    ),
+]
+
+
+def run_case(make_section, parse, discover, check, params, linear_lookup, count):
+    """Return (indexed_seconds, linear_seconds) for one check cycle"""
+    string_table = [[json.dumps(make_section(count))]]
+    section = parse(string_table)
+    items = [service.item for service in discover(section)]
+
+    def check_all(lookup=None):
+        for item in items:
+            if lookup is not None:
+                lookup(section, item)
+            if params is None:
+                list(check(item, section))
+            else:
+                list(check(item, params, section))
+
+    start = time.perf_counter()
+    check_all()
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    check_all(linear_lookup)
+    linear = time.perf_counter() - start
+    return indexed, linear
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 4000, 10000],
+                        help="Item counts to benchmark")
+    args = parser.parse_args()
+
+    print(f"{'section':<16}{'items':>8}{'indexed (ms)':>16}{'linear scan (ms)':>20}{'speedup':>10}")
+    for name, make_section, parse, discover, check, params, linear_lookup in CASES:
+        for count in args.sizes:
+            indexed, linear = run_case(make_section, parse, discover, check, params,
+                                       linear_lookup, count)
+            print(f"{name:<16}{count:>8}{indexed * 1000:>16.1f}{linear * 1000:>20.1f}"
+                  f"{linear / indexed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
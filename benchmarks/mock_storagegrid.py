@@ -0,0 +1,659 @@
+#!/usr/bin/env python3
+"""
+Mock StorageGRID API server for local agent benchmarking
+
+Serves the /api/v4 endpoints used by agent_storagegrid (authorize,
+node-health, health/topology, alerts, accounts, accounts/{id}/usage and
+metric-query) from a synthetic grid of configurable size, with optional
+injected latency. Only the PromQL subset emitted by the agent is understood
+by the metric-query endpoint. Needs the openssl CLI for its self-signed
+certificate:
+
+    python3 benchmarks/mock_storagegrid.py --nodes 100 --tenants 2000 --latency-ms 20
+    agent_storagegrid --hostname 127.0.0.1:8443 --username root --password x --no-cert-check
+
+GET /mock/stats returns the number of requests served per endpoint. With
+--compress, responses are gzip or deflate encoded when the client accepts it.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import re
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+TOKEN = "mock-token"
+
+# Content codings the mock can send with --compress, in order of preference
+COMPRESSORS = {
+    "gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+    "deflate": lambda body: zlib.compress(body, 6),
+}
+
+
+class SyntheticGrid:
+    """Deterministic synthetic grid of sites, nodes, tenants and alerts"""
+
+    def __init__(self, sites=2, nodes=10, tenants=50, alerts=5, seed=42,
+                 bulk_tenant_coverage=1.0):
+        rng = random.Random(seed)
+        self.started = time.time()
+        self.sites = [
+            {"id": f"site-{i}", "name": f"Site{i}"} for i in range(sites)
+        ]
+        node_types = ["adminNode", "storageNode", "storageNode", "storageNode", "gatewayNode"]
+        self.nodes = []
+        for i in range(nodes):
+            site = self.sites[i % sites]
+            node_type = "adminNode" if i == 0 else node_types[i % len(node_types)]
+            self.nodes.append({
+                "id": f"node-{i:05d}",
+                "name": f"SG-{site['name']}-N{i:05d}",
+                "type": node_type,
+                "siteId": site["id"],
+                "siteName": site["name"],
+                "state": "connected",
+                "severity": "normal",
+                "storageType": "combined" if node_type == "storageNode" else None,
+                "ip": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            })
+        self.tenants = []
+        for i in range(tenants):
+            quota = rng.choice([0, 10 * 1024 ** 4, 50 * 1024 ** 4])
+            data = int(rng.uniform(0.1, 0.95) * (quota or 20 * 1024 ** 4))
+            self.tenants.append({
+                "id": f"{i:020d}",
+                "name": f"tenant-{i:05d}",
+                "policy": {"quotaObjectBytes": quota} if quota else {},
+                "dataBytes": data,
+                "objectCount": rng.randint(0, 5_000_000),
+            })
+        covered = int(len(self.tenants) * bulk_tenant_coverage)
+        self.bulk_tenants = self.tenants[:covered]
+        self.bulk_tenant_index = {tenant["id"]: tenant for tenant in self.bulk_tenants}
+        self.alerts = []
+        for i in range(alerts):
+            node = self.nodes[i % len(self.nodes)]
+            self.alerts.append({
+                "id": f"alert-{i}",
+                "name": f"Mock alert {i}",
+                "status": "active",
+                "startsAt": "2026-01-01T00:00:00Z",
+                "labels": {
+                    "severity": ["minor", "major", "critical"][i % 3],
+                    "alertname": f"MockAlert{i}",
+                    "node_id": node["id"],
+                    "instance": node["name"],
+                    "site_name": node["siteName"],
+                },
+                "annotations": {"summary": f"Synthetic alert {i}"},
+            })
+        self.node_values = {}
+        for node in self.nodes:
+            self.node_values[node["id"]] = {
+                "cpu": rng.uniform(1, 95),
+                "memory": rng.uniform(2, 60) * 1024 ** 3,
+                "memory_total": 64 * 1024 ** 3,
+                "data": rng.uniform(1, 80) * 1024 ** 4,
+                "metadata": rng.uniform(1, 500) * 1024 ** 3,
+                "metadata_allowed": 2 * 1024 ** 4,
+                "usable": rng.uniform(100, 200) * 1024 ** 4,
+                "total": 250 * 1024 ** 4,
+                "s3_ok_rate": rng.uniform(0, 500),
+                "s3_fail_rate": rng.uniform(0, 5),
+                "ilm_scan_rate": rng.uniform(100, 5000),
+                "ilm_period": rng.uniform(60, 8000),
+                "ilm_awaiting": rng.randint(0, 50000),
+                "disk_read_rate": rng.uniform(0, 200) * 1024 ** 2,
+                "disk_write_rate": rng.uniform(0, 200) * 1024 ** 2,
+                "net_rx_rate": rng.uniform(0, 100) * 1024 ** 2,
+                "net_tx_rate": rng.uniform(0, 100) * 1024 ** 2,
+            }
+            # Derived rather than drawn, so the values above stay the same for a seed
+            values = self.node_values[node["id"]]
+            values["s3_in_rate"] = values["s3_ok_rate"] * 256 * 1024
+            values["s3_out_rate"] = values["s3_ok_rate"] * 384 * 1024
+
+    def topology(self):
+        """Nested grid → site → node topology tree"""
+        return {
+            "id": "grid",
+            "name": "MockGrid",
+            "type": "grid",
+            "children": [
+                {
+                    "id": site["id"],
+                    "name": site["name"],
+                    "type": "site",
+                    "children": [
+                        {"id": n["id"], "name": n["name"], "type": n["type"], "ip": n["ip"]}
+                        for n in self.nodes if n["siteId"] == site["id"]
+                    ],
+                }
+                for site in self.sites
+            ],
+        }
+
+    def node_health(self):
+        return [
+            {k: v for k, v in node.items() if k != "ip"} for node in self.nodes
+        ]
+
+    def series(self, name, tenant_ids=None):
+        """Raw series for a metric name as (labels, value) pairs
+
+        tenant_ids limits the tenant usage metrics to those tenants, looked
+        up by id instead of filtering every tenant series.
+        """
+        elapsed = time.time() - self.started
+        out = []
+        if name.startswith("storagegrid_tenant_usage_"):
+            field = {
+                "storagegrid_tenant_usage_data_bytes": "dataBytes",
+                "storagegrid_tenant_usage_object_count": "objectCount",
+                "storagegrid_tenant_usage_quota_bytes": None,
+            }.get(name, "missing")
+            if field == "missing":
+                return out
+            tenants = self.bulk_tenants
+            if tenant_ids is not None:
+                tenants = [self.bulk_tenant_index[i] for i in tenant_ids if i in self.bulk_tenant_index]
+            for tenant in tenants:
+                if field is None:
+                    value = tenant["policy"].get("quotaObjectBytes", 0)
+                else:
+                    value = tenant[field]
+                out.append(({"__name__": name, "tenant_id": tenant["id"],
+                             "instance": self.nodes[0]["name"]}, float(value)))
+            return out
+        mapping = {
+            "storagegrid_node_cpu_utilization_percentage": ("cpu", None),
+            "storagegrid_node_memory_utilization_bytes": ("memory", None),
+            "node_memory_MemTotal_bytes": ("memory_total", None),
+            "storagegrid_storage_utilization_data_bytes": ("data", "storageNode"),
+            "storagegrid_storage_utilization_metadata_bytes": ("metadata", "storageNode"),
+            "storagegrid_storage_utilization_metadata_allowed_bytes": ("metadata_allowed", "storageNode"),
+            "storagegrid_storage_utilization_usable_space_bytes": ("usable", "storageNode"),
+            "storagegrid_storage_utilization_total_space_bytes": ("total", "storageNode"),
+            "storagegrid_ilm_scan_rate": ("ilm_scan_rate", "storageNode"),
+            "storagegrid_ilm_scan_period_estimated_minutes": ("ilm_period", "storageNode"),
+            "storagegrid_ilm_awaiting_background_objects": ("ilm_awaiting", "storageNode"),
+        }
+        counters = {
+            "storagegrid_s3_operations_successful": "s3_ok_rate",
+            "storagegrid_s3_operations_failed": "s3_fail_rate",
+            "storagegrid_s3_data_transfers_bytes_ingested": "s3_in_rate",
+            "storagegrid_s3_data_transfers_bytes_retrieved": "s3_out_rate",
+        }
+        device_counters = {
+            "node_disk_read_bytes_total": ("disk_read_rate", ["sda", "sdb"]),
+            "node_disk_written_bytes_total": ("disk_write_rate", ["sda", "sdb"]),
+            "node_network_receive_bytes_total": ("net_rx_rate", ["eth0", "eth1", "lo"]),
+            "node_network_transmit_bytes_total": ("net_tx_rate", ["eth0", "eth1", "lo"]),
+        }
+        for node in self.nodes:
+            labels = {
+                "__name__": name,
+                "instance": node["name"],
+                "node_id": node["id"],
+                "site_id": node["siteId"],
+                "site_name": node["siteName"],
+                "job": "storagegrid",
+            }
+            values = self.node_values[node["id"]]
+            if name in mapping:
+                key, node_type = mapping[name]
+                if node_type and node["type"] != node_type:
+                    continue
+                out.append((labels, float(values[key])))
+            elif name in counters:
+                if node["type"] not in ("storageNode", "gatewayNode"):
+                    continue
+                rate = values[counters[name]]
+                out.append((dict(labels, _rate=rate), 1_000_000 + rate * elapsed))
+            elif name in device_counters:
+                key, devices = device_counters[name]
+                for device in devices:
+                    rate = values[key] / len(devices)
+                    out.append((dict(labels, device=device, _rate=rate), rate * elapsed))
+        return out
+
+
+class PromQLError(Exception):
+    pass
+
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+      (?P<str>"(?:[^"\\]|\\.)*")
+    | (?P<num>\d+(?:\.\d+)?[smhd]?)
+    | (?P<op>=~|!~|!=|=|\(|\)|\{|\}|\[|\]|,)
+    | (?P<ident>[A-Za-z_:][A-Za-z0-9_:]*)
+    )""", re.VERBOSE)
+
+AGGREGATIONS = {
+    "sum": sum,
+    "count": len,
+    "max": max,
+    "min": min,
+    "avg": lambda values: sum(values) / len(values),
+}
+
+
+class PromQL:
+    """Tiny evaluator for the PromQL subset the agent sends"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.tokens = []
+        self.pos = 0
+
+    def evaluate(self, query):
+        self.tokens = self._tokenize(query)
+        self.pos = 0
+        result = self._or_expr()
+        if self.pos != len(self.tokens):
+            raise PromQLError(f"unexpected token {self.tokens[self.pos][1]!r}")
+        return result
+
+    @staticmethod
+    def _tokenize(query):
+        tokens = []
+        pos = 0
+        query = query.strip()
+        while pos < len(query):
+            match = TOKEN_RE.match(query, pos)
+            if not match or match.end() == pos:
+                raise PromQLError(f"cannot parse query at {query[pos:]!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            pos = match.end()
+            while pos < len(query) and query[pos].isspace():
+                pos += 1
+        return tokens
+
+    def _peek(self, value=None):
+        if self.pos >= len(self.tokens):
+            return None
+        token = self.tokens[self.pos]
+        if value is not None and token[1] != value:
+            return None
+        return token
+
+    def _take(self, value=None):
+        token = self._peek(value)
+        if token is None:
+            raise PromQLError(f"expected {value!r}")
+        self.pos += 1
+        return token[1]
+
+    def _or_expr(self):
+        left = self._unary()
+        while self._peek("or"):
+            self._take("or")
+            right = self._unary()
+            seen = {self._key(labels) for labels, _ in left}
+            left = left + [(l, v) for l, v in right if self._key(l) not in seen]
+        return left
+
+    @staticmethod
+    def _key(labels):
+        return tuple(sorted((k, v) for k, v in labels.items() if k != "_rate"))
+
+    def _labels(self):
+        self._take("(")
+        labels = []
+        while not self._peek(")"):
+            labels.append(self._take())
+            if self._peek(","):
+                self._take(",")
+        self._take(")")
+        return labels
+
+    def _unary(self):
+        token = self._peek()
+        if token is None:
+            raise PromQLError("unexpected end of query")
+        kind, value = token
+        if value == "(":
+            self._take("(")
+            result = self._or_expr()
+            self._take(")")
+            return result
+        if kind == "ident" and value in AGGREGATIONS:
+            self._take()
+            by = None
+            if self._peek("by"):
+                self._take("by")
+                by = self._labels()
+            self._take("(")
+            inner = self._or_expr()
+            self._take(")")
+            if self._peek("by"):
+                self._take("by")
+                by = self._labels()
+            return self._aggregate(AGGREGATIONS[value], inner, by or [])
+        if kind == "ident" and value in ("rate", "increase"):
+            self._take()
+            self._take("(")
+            series = self._selector()
+            self._take("[")
+            window = self._take()
+            self._take("]")
+            self._take(")")
+            seconds = self._duration(window)
+            out = []
+            for labels, _ in series:
+                rate = labels.get("_rate", 0.0)
+                labels = {k: v for k, v in labels.items() if k not in ("__name__", "_rate")}
+                out.append((labels, rate if value == "rate" else rate * seconds))
+            return out
+        if kind == "ident" and value == "label_replace":
+            self._take()
+            self._take("(")
+            inner = self._or_expr()
+            args = []
+            for _ in range(4):
+                self._take(",")
+                args.append(json.loads(self._take()))
+            self._take(")")
+            dst, replacement, src, regex = args
+            out = []
+            for labels, val in inner:
+                if re.fullmatch(regex, labels.get(src, "")):
+                    labels = dict(labels, **{dst: replacement})
+                out.append((labels, val))
+            return out
+        return self._selector()
+
+    @staticmethod
+    def _duration(text):
+        units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+        if text[-1] in units:
+            return float(text[:-1]) * units[text[-1]]
+        return float(text)
+
+    def _selector(self):
+        name = None
+        matchers = []
+        if self._peek() and self._peek()[0] == "ident":
+            name = self._take()
+        if self._peek("{"):
+            self._take("{")
+            while not self._peek("}"):
+                label = self._take()
+                op = self._take()
+                value = json.loads(self._take())
+                matchers.append((label, op, value))
+                if self._peek(","):
+                    self._take(",")
+            self._take("}")
+        names = [name] if name else []
+        tenant_ids = None
+        for label, op, value in matchers:
+            if label == "__name__" and op == "=":
+                names = [value]
+            elif label == "__name__" and op == "=~":
+                names = value.split("|")
+            elif label == "tenant_id" and op == "=~" and all(
+                    re.escape(part) == part for part in value.split("|")):
+                # Alternation of literal ids, as the agent sends per page of accounts
+                tenant_ids = value.split("|")
+        out = []
+        for metric in names:
+            for labels, val in self.grid.series(metric, tenant_ids):
+                if all(self._match(labels, m) for m in matchers):
+                    out.append((labels, val))
+        return out
+
+    @staticmethod
+    def _match(labels, matcher):
+        label, op, value = matcher
+        actual = labels.get(label, "")
+        if op == "=":
+            return actual == value
+        if op == "!=":
+            return actual != value
+        if op == "=~":
+            return re.fullmatch(value, actual) is not None
+        return re.fullmatch(value, actual) is None
+
+    @staticmethod
+    def _aggregate(func, series, by):
+        groups = {}
+        for labels, value in series:
+            key = tuple((label, labels.get(label, "")) for label in by)
+            groups.setdefault(key, []).append(value)
+        return [(dict(key), float(func(values))) for key, values in groups.items()]
+
+
+def account(tenant):
+    """grid/accounts entry of a tenant, with the fields a real account record carries"""
+    return {
+        "id": tenant["id"],
+        "name": tenant["name"],
+        "capabilities": ["management", "s3"],
+        "policy": dict(
+            tenant["policy"],
+            useAccountIdentitySource=True,
+            allowPlatformServices=False,
+            allowSelectObjectContent=False,
+        ),
+        "created": "2025-01-01T00:00:00.000Z",
+    }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, which Nagle plus delayed ACKs would stall by ~40 ms
+    disable_nagle_algorithm = True
+    server_version = "MockStorageGRID/1.0"
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        pass
+
+    def _content_encoding(self):
+        """First coding of the request's Accept-Encoding the mock can send, or None"""
+        if not self.server.compress:
+            return None
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            coding = coding.split(";", 1)[0].strip().lower()
+            if coding in COMPRESSORS:
+                return coding
+        return None
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        encoding = self._content_encoding()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            body = COMPRESSORS[encoding](body)
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _delay(self):
+        latency = self.server.latency
+        if latency:
+            time.sleep(latency)
+
+    def _count(self, endpoint):
+        with self.server.lock:
+            self.server.stats["requests"] += 1
+            per_endpoint = self.server.stats["endpoints"]
+            per_endpoint[endpoint] = per_endpoint.get(endpoint, 0) + 1
+
+    def do_POST(self):
+        self._delay()
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        path = urlparse(self.path).path
+        if path == "/api/v4/authorize":
+            self._count("authorize")
+            self._send(200, {"status": "success", "data": TOKEN})
+        else:
+            self._send(404, {"status": "error", "message": "not found"})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        if path == "/mock/stats":
+            with self.server.lock:
+                self._send(200, self.server.stats)
+            return
+        self._delay()
+        if path == "/api/versions":
+            self._count("versions")
+            return self._send(200, {"status": "success", "apiVersion": "4.0", "data": [3, 4]})
+        if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+            self._count("unauthorized")
+            self._send(401, {"status": "error", "message": "unauthorized"})
+            return
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self._count("unavailable")
+            headers = {}
+            if self.server.retry_after is not None:
+                headers["Retry-After"] = str(self.server.retry_after)
+            self._send(503, {"status": "error", "message": "service unavailable"}, headers)
+            return
+        grid = self.server.grid
+        route = path[len("/api/v4/"):] if path.startswith("/api/v4/") else path
+        if route == "grid/node-health":
+            self._count(route)
+            return self._send(200, {"status": "success", "data": grid.node_health()})
+        if route == "grid/health/topology":
+            self._count(route)
+            return self._send(200, {"status": "success", "data": grid.topology()})
+        if route == "grid/alerts":
+            self._count(route)
+            return self._send(200, {"status": "success", "data": grid.alerts})
+        if route == "grid/accounts":
+            self._count(route)
+            params = parse_qs(parsed.query)
+            tenants = grid.tenants
+            if "marker" in params:
+                position = self.server.tenant_position.get(params["marker"][0])
+                if position is None:
+                    return self._send(400, {"status": "error", "message": "invalid marker"})
+                tenants = tenants[position + 1:]
+            if "limit" in params:
+                tenants = tenants[:int(params["limit"][0])]
+            return self._send(200, {"status": "success", "data": [account(t) for t in tenants]})
+        match = re.fullmatch(r"grid/accounts/([^/]+)/usage", route)
+        if match:
+            self._count("grid/accounts/{id}/usage")
+            tenant = self.server.tenant_index.get(unquote(match.group(1)))
+            if tenant is None:
+                return self._send(404, {"status": "error", "message": "no such account"})
+            return self._send(200, {"status": "success", "data": {
+                "calculationTime": "2026-01-01T00:00:00Z",
+                "dataBytes": tenant["dataBytes"],
+                "objectCount": tenant["objectCount"],
+            }})
+        if route == "grid/metric-query":
+            self._count(route)
+            query = parse_qs(parsed.query).get("query", [""])[0]
+            try:
+                series = PromQL(grid).evaluate(query)
+            except PromQLError as e:
+                return self._send(422, {"status": "error", "message": str(e)})
+            now = time.time()
+            return self._send(200, {"status": "success", "data": {
+                "resultType": "vector",
+                "result": [
+                    {
+                        "metric": {k: v for k, v in labels.items() if k != "_rate"},
+                        "value": [now, repr(value)],
+                    }
+                    for labels, value in series
+                ],
+            }})
+        self._send(404, {"status": "error", "message": "not found"})
+
+
+def make_certificate(directory):
+    """Create a throwaway self-signed certificate with the openssl CLI, once per directory"""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    if os.path.exists(cert) and os.path.exists(key):
+        return cert, key
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-keyout", key, "-out", cert],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def create_server(grid, host="127.0.0.1", port=0, latency=0.0, certdir=None, error_rate=0.0,
+                  retry_after=None, compress=False):
+    """Create (but do not start) a TLS mock server for the given grid
+
+    error_rate is the fraction of API GET requests answered with HTTP 503,
+    with a Retry-After header if retry_after is set. With compress, responses
+    are compressed when the client accepts gzip or deflate.
+    """
+    server = ThreadingHTTPServer((host, port), MockHandler)
+    server.daemon_threads = True
+    server.grid = grid
+    server.tenant_index = {t["id"]: t for t in grid.tenants}
+    server.tenant_position = {t["id"]: i for i, t in enumerate(grid.tenants)}
+    server.latency = latency
+    server.error_rate = error_rate
+    server.retry_after = retry_after
+    server.compress = compress
+    server.lock = threading.Lock()
+    server.stats = {"requests": 0, "endpoints": {}}
+    certdir = certdir or tempfile.mkdtemp(prefix="mock_storagegrid_")
+    cert, key = make_certificate(certdir)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock StorageGRID API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--sites", type=int, default=2)
+    parser.add_argument("--nodes", type=int, default=10)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--alerts", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Delay added to every API response")
+    parser.add_argument("--bulk-tenant-coverage", type=float, default=1.0,
+                        help="Fraction of tenants present in the tenant usage metrics")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of API GET requests answered with HTTP 503")
+    parser.add_argument("--retry-after", type=int, default=None,
+                        help="Retry-After seconds sent with injected 503 responses")
+    parser.add_argument("--compress", action="store_true",
+                        help="Compress responses with gzip or deflate if the client accepts it")
+    args = parser.parse_args()
+    grid = SyntheticGrid(args.sites, args.nodes, args.tenants, args.alerts,
+                         bulk_tenant_coverage=args.bulk_tenant_coverage)
+    server = create_server(grid, host=args.host, port=args.port, latency=args.latency_ms / 1000,
+                           error_rate=args.error_rate, retry_after=args.retry_after,
+                           compress=args.compress)
+    print(f"Mock StorageGRID listening on https://{args.host}:{server.server_address[1]}",
+          file=sys.stderr)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+CheckMK Check Plugin for StorageGRID Special Agent Performance
+CheckMK 2.4.0 API (agent_based v2)
+"""
+
+import json
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    CheckPlugin,
+    Service,
+    Result,
+    State,
+    Metric,
+    check_levels,
+    render,
+    CheckResult,
+    DiscoveryResult,
+    StringTable,
+)
+
+# Collectors with a dedicated runtime metric, see graphing/storagegrid_agent_perf.py
+COLLECTOR_METRICS = (
+    "health", "alerts", "capacity", "s3_performance", "s3_nodes", "resources", "tenant_usage", "ilm"
+)
+
+
+def parse_storagegrid_agent_perf(string_table: StringTable) -> dict | None:
+    """Parse agent performance data"""
+    if not string_table:
+        return None
+
+    try:
+        return json.loads(string_table[0][0])
+    except (IndexError, json.JSONDecodeError, ValueError):
+        return None
+
+
+def discover_storagegrid_agent_perf(section: dict) -> DiscoveryResult:
+    """Discover agent performance service"""
+    if section and 'run_seconds' in section:
+        yield Service()
+
+
+def check_storagegrid_agent_perf(params: dict, section: dict) -> CheckResult:
+    """Check run time and request statistics of the special agent"""
+    if not section or 'run_seconds' not in section:
+        yield Result(state=State.UNKNOWN, summary="No data available")
+        return
+
+    yield from check_levels(
+        value=section['run_seconds'],
+        levels_upper=params.get('runtime_levels', ("fixed", (45.0, 55.0))),
+        metric_name="storagegrid_agent_runtime",
+        label="Run time",
+        render_func=render.timespan,
+    )
+
+    collectors = section.get('collectors', {})
+    timed = {name: stats['seconds'] for name, stats in collectors.items() if 'seconds' in stats}
+    if timed:
+        slowest = max(timed, key=timed.get)
+        yield Result(
+            state=State.OK,
+            summary=f"Slowest section: {slowest} ({render.timespan(timed[slowest])})"
+        )
+    for name in sorted(timed):
+        if name in COLLECTOR_METRICS:
+            yield Metric(name=f"storagegrid_collector_{name}_seconds", value=timed[name])
+
+    skipped = sorted(name for name, stats in collectors.items() if stats.get('skipped'))
+    if skipped:
+        yield Result(
+            state=State.WARN,
+            summary=f"Not collected before run deadline: {', '.join(skipped)}"
+        )
+
+    failed = sorted(
+        name for name, stats in collectors.items() if stats.get('error') and not stats.get('skipped')
+    )
+    if failed:
+        yield Result(state=State.OK, notice=f"Sections with errors: {', '.join(failed)}")
+
+    failed_queries = {
+        name: stats['failed_queries'] for name, stats in collectors.items() if stats.get('failed_queries')
+    }
+    if failed_queries:
+        yield Result(
+            state=State.OK,
+            notice="Failed metric queries: " + ", ".join(
+                f"{name} ({count})" for name, count in sorted(failed_queries.items())
+            )
+        )
+
+    endpoints = section.get('endpoints', {})
+    requests = sum(stats['requests'] for stats in endpoints.values())
+    response_bytes = sum(stats['bytes'] for stats in endpoints.values())
+    # Agents before response compression only report decoded bytes
+    wire_bytes = sum(stats.get('wire_bytes', stats['bytes']) for stats in endpoints.values())
+    yield Metric(name="storagegrid_agent_requests", value=requests)
+    yield Metric(name="storagegrid_agent_response_bytes", value=response_bytes)
+    yield Metric(name="storagegrid_agent_wire_bytes", value=wire_bytes)
+    transfer = render.bytes(response_bytes)
+    if wire_bytes != response_bytes:
+        transfer = f"{render.bytes(wire_bytes)} transferred, {transfer} decoded"
+    yield Result(state=State.OK, summary=f"API requests: {requests} ({transfer})")
+
+    for name, stats in sorted(endpoints.items(), key=lambda entry: -entry[1]['seconds']):
+        average = stats['seconds'] / stats['requests'] if stats['requests'] else 0.0
+        errors = f", {stats['errors']} failed" if stats['errors'] else ""
+        errors += f", {stats['retries']} retried" if stats.get('retries') else ""
+        transfer = render.bytes(stats['bytes'])
+        if stats.get('wire_bytes', stats['bytes']) != stats['bytes']:
+            transfer = f"{render.bytes(stats['wire_bytes'])} transferred, {transfer} decoded"
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"{name}: {stats['requests']} requests{errors}, "
+                f"avg {render.timespan(average)}, max {render.timespan(stats['max_seconds'])}, "
+                f"{transfer}"
+            )
+        )
+
+    retries = section.get('retries', 0)
+    retry_seconds = section.get('retry_seconds', 0.0)
+    yield Metric(name="storagegrid_agent_retries", value=retries)
+    yield Metric(name="storagegrid_agent_retry_seconds", value=retry_seconds)
+    if retries:
+        yield Result(
+            state=State.OK,
+            summary=f"Retried requests: {retries} (waited {render.timespan(retry_seconds)})"
+        )
+
+    connections = section.get('connections', {}).get('connections_opened')
+    if connections is not None:
+        yield Metric(name="storagegrid_agent_connections", value=connections)
+        yield Result(state=State.OK, notice=f"HTTP connections opened: {connections}")
+
+    admin_nodes = section.get('admin_nodes', [])
+    for node in admin_nodes:
+        breaker = node.get('breaker', {})
+        if breaker.get('state') in ("open", "half_open"):
+            yield Result(
+                state=State.WARN,
+                summary=(
+                    f"Circuit breaker {breaker['state'].replace('_', '-')} for {node['host']} after "
+                    f"{breaker.get('failures', 0)} consecutive failures, "
+                    f"{breaker.get('rejected', 0)} requests not sent"
+                )
+            )
+
+    if len(admin_nodes) > 1:
+        down = [node['host'] for node in admin_nodes if not node.get('healthy', True)]
+        if down:
+            yield Result(state=State.WARN, summary=f"Admin nodes not responding: {', '.join(down)}")
+        preferred = next((node['host'] for node in admin_nodes if node.get('healthy', True)), None)
+        if preferred:
+            yield Result(state=State.OK, summary=f"Preferred admin node: {preferred}")
+
+    for node in admin_nodes:
+        probe = node.get('probe_seconds')
+        details = f"probe {render.timespan(probe)}, " if probe is not None else ""
+        details += f"{node.get('requests', 0)} requests"
+        details += f", {node['failovers']} failed over" if node.get('failovers') else ""
+        details += f", circuit breaker {node.get('breaker', {}).get('state', 'disabled')}"
+        yield Result(state=State.OK, notice=f"Admin node {node['host']}: {details}")
+
+    daemon = section.get('daemon')
+    if daemon:
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"Collected by collector daemon (PID {daemon.get('pid')}), sections in this pass: "
+                f"{', '.join(daemon.get('collected', [])) or 'none'}"
+            )
+        )
+
+    token_cache = section.get('auth', {}).get('token_cache')
+    if token_cache:
+        yield Result(state=State.OK, notice=f"Token cache: {token_cache}")
+
+    health = collectors.get('health', {})
+    if health.get('topology_error'):
+        yield Result(state=State.OK, notice=f"Topology request failed: {health['topology_error']}")
+    elif health.get('topology_cache'):
+        yield Result(state=State.OK, notice=f"Topology cache: {health['topology_cache']}")
+
+    tenant_usage = collectors.get('tenant_usage', {})
+    if tenant_usage.get('refresh_shard'):
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"Tenant usage refresh shard {tenant_usage['refresh_shard']}: "
+                f"{tenant_usage.get('per_tenant', 0)} tenants fetched, "
+                f"{tenant_usage.get('reused', 0)} reused from earlier runs"
+            )
+        )
+
+    cache_states = [stats['cache'] for stats in collectors.values() if 'cache' in stats]
+    if cache_states:
+        hit_ratio = 100.0 * cache_states.count("hit") / len(cache_states)
+        yield Metric(name="storagegrid_section_cache_hit_ratio", value=hit_ratio, boundaries=(0.0, 100.0))
+        yield Result(
+            state=State.OK,
+            notice=f"Section cache hits: {cache_states.count('hit')} of {len(cache_states)} cached sections"
+        )
+
+
+agent_section_storagegrid_agent_perf = AgentSection(
+    name="storagegrid_agent_perf",
+    parse_function=parse_storagegrid_agent_perf,
+)
+
+check_plugin_storagegrid_agent_perf = CheckPlugin(
+    name="storagegrid_agent_perf",
+    service_name="StorageGRID Agent Performance",
+    discovery_function=discover_storagegrid_agent_perf,
+    check_function=check_storagegrid_agent_perf,
+    check_default_parameters={
+        'runtime_levels': ("fixed", (45.0, 55.0)),
+    },
+    check_ruleset_name="storagegrid_agent_perf",
+    sections=["storagegrid_agent_perf"],
+)
@@ -18,6 +18,8 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_alerts(string_table: StringTable) -> dict | None:
     """Parse alerts data"""
@@ -46,6 +48,8 @@ def check_storagegrid_alerts(section: dict) -> CheckResult:
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
+    yield from check_stale_data(section)
+
     alerts = section.get('alerts', [])
 
     critical_alerts = [a for a in alerts if a.get('severity') == 'critical']
@@ -20,6 +20,8 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_capacity(string_table: StringTable) -> dict | None:
     """Parse capacity data"""
@@ -48,6 +50,8 @@ def check_storagegrid_data_capacity(params: dict, section: dict) -> CheckResult:
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
+    yield from check_stale_data(section)
+
     data_bytes = section.get('data_bytes')
     usable_bytes = section.get('usable_space_bytes')
     data_percent = section.get('data_percent')
@@ -108,6 +112,8 @@ def check_storagegrid_metadata_capacity(params: dict, section: dict) -> CheckRes
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
+    yield from check_stale_data(section)
+
     metadata_bytes = section.get('metadata_bytes')
     metadata_allowed = section.get('metadata_allowed_bytes')
     metadata_percent = section.get('metadata_percent')
@@ -17,17 +17,30 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_health(string_table: StringTable) -> dict | None:
-    """Parse agent output for health data"""
+    """Parse agent output for health data, indexing sites and nodes by item"""
     if not string_table:
         return None
 
     try:
-        return json.loads(string_table[0][0])
+        section = json.loads(string_table[0][0])
     except (IndexError, json.JSONDecodeError, ValueError):
         return None
 
+    sites_by_name = {}
+    nodes_by_item = {}
+    for site in section.get('sites', []):
+        sites_by_name.setdefault(site['name'], site)
+        for node in site.get('nodes', []):
+            nodes_by_item.setdefault(f"{site['name']}/{node['name']}", node)
+
+    section['sites_by_name'] = sites_by_name
+    section['nodes_by_item'] = nodes_by_item
+    return section
+
 
 def discover_storagegrid_nodes(section: dict) -> DiscoveryResult:
     """Discover services for each node"""
@@ -49,49 +62,42 @@ def check_storagegrid_node(item: str, section: dict) -> CheckResult:
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
-    site_name, node_name = item.split('/', 1)
+    yield from check_stale_data(section)
 
-    for site in section.get('sites', []):
-        if site['name'] != site_name:
-            continue
+    node = section.get('nodes_by_item', {}).get(item)
+    if node is None:
+        yield Result(state=State.UNKNOWN, summary=f"Node {item} not found in monitoring data")
+        return
 
-        for node in site.get('nodes', []):
-            if node['name'] != node_name:
-                continue
-
-            node_state = node.get('state', 'unknown')
-            severity = node.get('severity', 'unknown')
-            node_type = node.get('type', 'unknown')
-
-            if node_state == 'connected' and severity == 'normal':
-                yield Result(
-                    state=State.OK,
-                    summary=f"{node_type} is healthy"
-                )
-            elif node_state == 'connected' and severity == 'minor':
-                yield Result(
-                    state=State.WARN,
-                    summary=f"{node_type} has minor issues"
-                )
-            elif node_state == 'administrativelyDown':
-                yield Result(
-                    state=State.WARN,
-                    summary=f"{node_type} is administratively down"
-                )
-            elif node_state == 'unknown':
-                yield Result(
-                    state=State.UNKNOWN,
-                    summary=f"{node_type} state cannot be determined"
-                )
-            else:
-                yield Result(
-                    state=State.CRIT,
-                    summary=f"{node_type} state: {node_state}, severity: {severity}"
-                )
-
-            return
-
-    yield Result(state=State.UNKNOWN, summary=f"Node {item} not found in monitoring data")
+    node_state = node.get('state', 'unknown')
+    severity = node.get('severity', 'unknown')
+    node_type = node.get('type', 'unknown')
+
+    if node_state == 'connected' and severity == 'normal':
+        yield Result(
+            state=State.OK,
+            summary=f"{node_type} is healthy"
+        )
+    elif node_state == 'connected' and severity == 'minor':
+        yield Result(
+            state=State.WARN,
+            summary=f"{node_type} has minor issues"
+        )
+    elif node_state == 'administrativelyDown':
+        yield Result(
+            state=State.WARN,
+            summary=f"{node_type} is administratively down"
+        )
+    elif node_state == 'unknown':
+        yield Result(
+            state=State.UNKNOWN,
+            summary=f"{node_type} state cannot be determined"
+        )
+    else:
+        yield Result(
+            state=State.CRIT,
+            summary=f"{node_type} state: {node_state}, severity: {severity}"
+        )
 
 
 def discover_storagegrid_site(section: dict) -> DiscoveryResult:
@@ -113,37 +119,39 @@ def check_storagegrid_site(item: str, section: dict) -> CheckResult:
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
-    for site in section.get('sites', []):
-        if site['name'] != item:
-            continue
-
-        site_state = site.get('state', 'unknown')
-        node_count = len(site.get('nodes', []))
-
-        disconnected_nodes = []
-        for node in site.get('nodes', []):
-            if node.get('state') != 'connected':
-                disconnected_nodes.append(node['name'])
-
-        if site_state == 'connected' and not disconnected_nodes:
-            yield Result(
-                state=State.OK,
-                summary=f"Site operational with {node_count} nodes"
-            )
-        elif disconnected_nodes:
-            yield Result(
-                state=State.CRIT,
-                summary=f"Site has {len(disconnected_nodes)} disconnected nodes: {', '.join(disconnected_nodes)}"
-            )
-        else:
-            yield Result(
-                state=State.WARN,
-                summary=f"Site state: {site_state}, {node_count} nodes"
-            )
+    yield from check_stale_data(section)
 
+    site = section.get('sites_by_name', {}).get(item)
+    if site is None:
+        yield Result(state=State.UNKNOWN, summary=f"Site {item} not found in monitoring data")
         return
 
-    yield Result(state=State.UNKNOWN, summary=f"Site {item} not found in monitoring data")
+    if section.get('topology_error'):
+        yield Result(state=State.OK, notice=f"Node IP addresses unavailable: {section['topology_error']}")
+
+    site_state = site.get('state', 'unknown')
+    node_count = len(site.get('nodes', []))
+
+    disconnected_nodes = []
+    for node in site.get('nodes', []):
+        if node.get('state') != 'connected':
+            disconnected_nodes.append(node['name'])
+
+    if site_state == 'connected' and not disconnected_nodes:
+        yield Result(
+            state=State.OK,
+            summary=f"Site operational with {node_count} nodes"
+        )
+    elif disconnected_nodes:
+        yield Result(
+            state=State.CRIT,
+            summary=f"Site has {len(disconnected_nodes)} disconnected nodes: {', '.join(disconnected_nodes)}"
+        )
+    else:
+        yield Result(
+            state=State.WARN,
+            summary=f"Site state: {site_state}, {node_count} nodes"
+        )
 
 
 agent_section_storagegrid_health = AgentSection(
@@ -18,6 +18,8 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_ilm(string_table: StringTable) -> dict | None:
     """Parse ILM data"""
@@ -46,6 +48,8 @@ def check_storagegrid_ilm(params: dict, section: dict) -> CheckResult:
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
+    yield from check_stale_data(section)
+
     scan_rate = section.get('scan_rate')
     scan_period_minutes = section.get('scan_period_minutes')
     awaiting_objects = section.get('awaiting_background_objects')
@@ -13,22 +13,34 @@ from cmk.agent_based.v2 import (
     Result,
     State,
     Metric,
+    render,
     CheckResult,
     DiscoveryResult,
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_resources(string_table: StringTable) -> dict | None:
-    """Parse node resource data"""
+    """Parse node resource data, indexing nodes by name"""
     if not string_table:
         return None
 
     try:
-        return json.loads(string_table[0][0])
+        section = json.loads(string_table[0][0])
     except (IndexError, json.JSONDecodeError, ValueError):
         return None
 
+    nodes_by_name = {}
+    for node in section.get('nodes', []):
+        node_name = node.get('node')
+        if node_name:
+            nodes_by_name.setdefault(node_name, node)
+
+    section['nodes_by_name'] = nodes_by_name
+    return section
+
 
 def discover_storagegrid_node_resources(section: dict) -> DiscoveryResult:
     """Discover node resource services"""
@@ -51,53 +63,83 @@ def check_storagegrid_node_resources(item: str, params: dict, section: dict) ->
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
-    for node in section.get('nodes', []):
-        if node.get('node') != item:
-            continue
-
-        cpu_percent = node.get('cpu_percent')
-        memory_bytes = node.get('memory_bytes')
-
-        if cpu_percent is not None:
-            # Get thresholds
-            warn, crit = params.get('cpu_levels', (80.0, 90.0))
-
-            # Determine state
-            if cpu_percent >= crit:
-                state = State.CRIT
-            elif cpu_percent >= warn:
-                state = State.WARN
-            else:
-                state = State.OK
-
-            # Build summary
-            summary = f"CPU: {cpu_percent:.1f}%"
-            if state != State.OK:
-                summary += f" (warn/crit at {warn:.1f}%/{crit:.1f}%)"
-
-            yield Result(state=state, summary=summary)
-
-            yield Metric(
-                name="cpu_utilization",
-                value=cpu_percent,
-                levels=(warn, crit),
-                boundaries=(0, 100)
-            )
-        else:
-            yield Result(state=State.OK, notice="CPU metrics not available")
-
-        if memory_bytes is not None:
-            yield Metric(name="memory_usage", value=memory_bytes)
-            yield Result(
-                state=State.OK,
-                notice=f"Memory usage: {memory_bytes / (1024**3):.2f} GB"
-            )
-        else:
-            yield Result(state=State.OK, notice="Memory metrics not available")
+    yield from check_stale_data(section)
 
+    node = section.get('nodes_by_name', {}).get(item)
+    if node is None:
+        yield Result(state=State.UNKNOWN, summary=f"Node {item} not found in resource data")
         return
 
-    yield Result(state=State.UNKNOWN, summary=f"Node {item} not found in resource data")
+    cpu_percent = node.get('cpu_percent')
+    memory_bytes = node.get('memory_bytes')
+
+    if cpu_percent is not None:
+        # Get thresholds
+        warn, crit = params.get('cpu_levels', (80.0, 90.0))
+
+        # Determine state
+        if cpu_percent >= crit:
+            state = State.CRIT
+        elif cpu_percent >= warn:
+            state = State.WARN
+        else:
+            state = State.OK
+
+        # Build summary
+        summary = f"CPU: {cpu_percent:.1f}%"
+        if state != State.OK:
+            summary += f" (warn/crit at {warn:.1f}%/{crit:.1f}%)"
+
+        yield Result(state=state, summary=summary)
+
+        yield Metric(
+            name="cpu_utilization",
+            value=cpu_percent,
+            levels=(warn, crit),
+            boundaries=(0, 100)
+        )
+    else:
+        yield Result(state=State.OK, notice="CPU metrics not available")
+
+    memory_total = node.get('memory_total_bytes')
+    if memory_bytes is not None and memory_total:
+        yield Metric(name="memory_usage", value=memory_bytes, boundaries=(0, memory_total))
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"Memory usage: {memory_bytes / (1024**3):.2f} GB of "
+                f"{memory_total / (1024**3):.2f} GB ({memory_bytes / memory_total * 100:.1f}%)"
+            )
+        )
+    elif memory_bytes is not None:
+        yield Metric(name="memory_usage", value=memory_bytes)
+        yield Result(
+            state=State.OK,
+            notice=f"Memory usage: {memory_bytes / (1024**3):.2f} GB"
+        )
+    else:
+        yield Result(state=State.OK, notice="Memory metrics not available")
+
+    # Disk and network throughput, reported when the node exports them
+    disk_read = node.get('disk_read_bytes_rate')
+    if disk_read is not None:
+        yield Metric(name="disk_read_throughput", value=disk_read)
+        yield Result(state=State.OK, notice=f"Disk read: {render.iobandwidth(disk_read)}")
+
+    disk_write = node.get('disk_write_bytes_rate')
+    if disk_write is not None:
+        yield Metric(name="disk_write_throughput", value=disk_write)
+        yield Result(state=State.OK, notice=f"Disk write: {render.iobandwidth(disk_write)}")
+
+    network_rx = node.get('network_rx_bytes_rate')
+    if network_rx is not None:
+        yield Metric(name="if_in_bps", value=network_rx * 8)
+        yield Result(state=State.OK, notice=f"Network in: {render.networkbandwidth(network_rx)}")
+
+    network_tx = node.get('network_tx_bytes_rate')
+    if network_tx is not None:
+        yield Metric(name="if_out_bps", value=network_tx * 8)
+        yield Result(state=State.OK, notice=f"Network out: {render.networkbandwidth(network_tx)}")
 
 
 agent_section_storagegrid_resources = AgentSection(
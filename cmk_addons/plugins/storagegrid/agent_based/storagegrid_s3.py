@@ -14,11 +14,18 @@ from cmk.agent_based.v2 import (
     State,
     Metric,
     check_levels,
+    render,
+    get_rate,
+    get_value_store,
+    GetRateError,
+    IgnoreResultsError,
     CheckResult,
     DiscoveryResult,
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_s3_performance(string_table: StringTable) -> dict | None:
     """Parse S3 performance data"""
@@ -37,6 +44,55 @@ def discover_storagegrid_s3_performance(section: dict) -> DiscoveryResult:
         yield Service()
 
 
+def _rates_from_counters(counters: dict, counters_time: float, value_store) -> tuple[dict, list[str]]:
+    """Rates summed over nodes from the per-node counters of --s3-counters
+
+    counters maps each counter to {node: value}. Each node's counters are
+    rated separately over the time between two collections, so that a
+    counter reset after a node restart only drops that node, with all of
+    its counters, from one interval. Returns ({counter: rate}, nodes with a
+    reset); a rate is None while no node has two readings of it yet.
+    """
+    last = value_store.get('rates')
+    if last is not None and counters_time <= last[0]:
+        # The same collection again, e.g. from the agent's section cache
+        return last[1], []
+
+    node_rates = {kind: {} for kind in counters}
+    reset = set()
+    keys = set()
+    for kind, rates in node_rates.items():
+        for node, value in counters[kind].items():
+            key = f"{kind}.{node}"
+            keys.add(key)
+            previous = value_store.get(key)
+            if previous is not None and value < previous[1]:
+                reset.add(node)
+            try:
+                rates[node] = get_rate(value_store, key, counters_time, value, raise_overflow=True)
+            except GetRateError:
+                continue
+
+    # Forget nodes that are gone
+    for key in [key for key in value_store if key != 'rates' and key not in keys]:
+        del value_store[key]
+
+    totals = {}
+    for kind, rates in node_rates.items():
+        counted = [rate for node, rate in rates.items() if node not in reset]
+        totals[kind] = sum(counted) if counted else None
+    value_store['rates'] = (counters_time, totals)
+    return totals, sorted(reset)
+
+
+def _check_counter_reset(reset: list[str]) -> CheckResult:
+    if reset:
+        yield Result(
+            state=State.OK,
+            notice=f"Counter reset on {len(reset)} nodes, left out of this interval: {', '.join(reset)}"
+        )
+
+
 def check_storagegrid_s3_performance(params: dict, section: dict) -> CheckResult:
     """Check S3 performance metrics"""
     if not section:
@@ -47,9 +103,23 @@ def check_storagegrid_s3_performance(params: dict, section: dict) -> CheckResult
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
-    successful_rate = section.get('successful_rate')
-    failed_rate = section.get('failed_rate')
-    error_percent = section.get('error_percent')
+    yield from check_stale_data(section)
+
+    if 'counters' in section:
+        counters = {kind: section['counters'].get(kind, {}) for kind in ("successful", "failed")}
+        rates, reset = _rates_from_counters(counters, section['counters_time'], get_value_store())
+        successful_rate, failed_rate = rates['successful'], rates['failed']
+        if successful_rate is None and failed_rate is None:
+            raise IgnoreResultsError("Initializing S3 operation counters")
+        yield from _check_counter_reset(reset)
+        error_percent = None
+        if successful_rate is not None and failed_rate is not None:
+            total_rate = successful_rate + failed_rate
+            error_percent = failed_rate / total_rate * 100 if total_rate > 0 else 0
+    else:
+        successful_rate = section.get('successful_rate')
+        failed_rate = section.get('failed_rate')
+        error_percent = section.get('error_percent')
 
     if successful_rate is not None:
         yield Metric(name="successful_request_rate", value=successful_rate)
@@ -103,3 +173,167 @@ check_plugin_storagegrid_s3_performance = CheckPlugin(
     check_ruleset_name="storagegrid_s3_performance",
     sections=["storagegrid_s3_performance"],
 )
+
+
+# Counters of the storagegrid_s3_nodes section, see S3_NODE_COUNTERS in the agent
+S3_NODE_COUNTERS = ("successful", "failed", "bytes_in", "bytes_out")
+
+
+def parse_storagegrid_s3_nodes(string_table: StringTable) -> dict | None:
+    """Parse per-node S3 traffic, indexing nodes by name and by site"""
+    if not string_table:
+        return None
+
+    try:
+        section = json.loads(string_table[0][0])
+    except (IndexError, json.JSONDecodeError, ValueError):
+        return None
+
+    nodes_by_name = {}
+    nodes_by_site = {}
+    for node in section.get('nodes', []):
+        node_name = node.get('node')
+        if node_name and node_name not in nodes_by_name:
+            nodes_by_name[node_name] = node
+            nodes_by_site.setdefault(node.get('site', 'unknown'), []).append(node)
+
+    section['nodes_by_name'] = nodes_by_name
+    section['nodes_by_site'] = nodes_by_site
+    return section
+
+
+def discover_storagegrid_s3_node(section: dict) -> DiscoveryResult:
+    """Discover one S3 traffic service per node"""
+    if not section or 'error' in section:
+        return
+
+    for node_name in section.get('nodes_by_name', {}):
+        yield Service(item=node_name)
+
+
+def discover_storagegrid_s3_site(section: dict) -> DiscoveryResult:
+    """Discover one S3 traffic service per site"""
+    if not section or 'error' in section:
+        return
+
+    for site_name in section.get('nodes_by_site', {}):
+        yield Service(item=site_name)
+
+
+def _check_s3_traffic(params: dict, section: dict, nodes: list[dict]) -> CheckResult:
+    """Check the S3 traffic of a group of nodes, summing their rates"""
+    if 'counters_time' in section:
+        counters = {
+            kind: {
+                node['node']: node['counters'][kind]
+                for node in nodes if kind in node.get('counters', {})
+            }
+            for kind in S3_NODE_COUNTERS
+        }
+        rates, reset = _rates_from_counters(counters, section['counters_time'], get_value_store())
+        if all(rate is None for rate in rates.values()):
+            raise IgnoreResultsError("Initializing S3 counters")
+        yield from _check_counter_reset(reset)
+    else:
+        rates = {}
+        for kind in S3_NODE_COUNTERS:
+            values = [node[f"{kind}_rate"] for node in nodes if f"{kind}_rate" in node]
+            rates[kind] = sum(values) if values else None
+
+    successful_rate, failed_rate = rates['successful'], rates['failed']
+    if successful_rate is None and failed_rate is None:
+        yield Result(state=State.UNKNOWN, summary="No S3 request data")
+    else:
+        successful_rate, failed_rate = successful_rate or 0.0, failed_rate or 0.0
+        total_rate = successful_rate + failed_rate
+        yield Metric(name="successful_request_rate", value=successful_rate)
+        yield Metric(name="failed_request_rate", value=failed_rate)
+        yield Result(state=State.OK, summary=f"Requests: {total_rate:.2f}/s")
+        yield from check_levels(
+            value=failed_rate / total_rate * 100 if total_rate > 0 else 0.0,
+            levels_upper=params.get('error_rate_levels', ("fixed", (1.0, 5.0))),
+            metric_name="error_rate",
+            label="Error rate",
+            render_func=lambda v: f"{v:.2f}%",
+        )
+
+    for kind, label in (("bytes_in", "In"), ("bytes_out", "Out")):
+        if rates[kind] is not None:
+            yield from check_levels(
+                value=rates[kind],
+                metric_name=f"s3_{kind}_rate",
+                label=label,
+                render_func=render.iobandwidth,
+            )
+
+
+def check_storagegrid_s3_node(item: str, params: dict, section: dict) -> CheckResult:
+    """Check S3 traffic of one node"""
+    if not section:
+        yield Result(state=State.UNKNOWN, summary="No data available")
+        return
+
+    if 'error' in section:
+        yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
+        return
+
+    yield from check_stale_data(section)
+
+    node = section.get('nodes_by_name', {}).get(item)
+    if node is None:
+        yield Result(state=State.UNKNOWN, summary=f"Node {item} not found in S3 data")
+        return
+
+    yield Result(state=State.OK, notice=f"Site: {node.get('site', 'unknown')}")
+    yield from _check_s3_traffic(params, section, [node])
+
+
+def check_storagegrid_s3_site(item: str, params: dict, section: dict) -> CheckResult:
+    """Check S3 traffic of all nodes of one site"""
+    if not section:
+        yield Result(state=State.UNKNOWN, summary="No data available")
+        return
+
+    if 'error' in section:
+        yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
+        return
+
+    yield from check_stale_data(section)
+
+    nodes = section.get('nodes_by_site', {}).get(item)
+    if not nodes:
+        yield Result(state=State.UNKNOWN, summary=f"Site {item} not found in S3 data")
+        return
+
+    yield Result(state=State.OK, notice=f"Nodes: {len(nodes)}")
+    yield from _check_s3_traffic(params, section, nodes)
+
+
+agent_section_storagegrid_s3_nodes = AgentSection(
+    name="storagegrid_s3_nodes",
+    parse_function=parse_storagegrid_s3_nodes,
+)
+
+check_plugin_storagegrid_s3_node = CheckPlugin(
+    name="storagegrid_s3_node",
+    service_name="StorageGRID S3 Node %s",
+    discovery_function=discover_storagegrid_s3_node,
+    check_function=check_storagegrid_s3_node,
+    check_default_parameters={
+        'error_rate_levels': ("fixed", (1.0, 5.0)),
+    },
+    check_ruleset_name="storagegrid_s3_traffic",
+    sections=["storagegrid_s3_nodes"],
+)
+
+check_plugin_storagegrid_s3_site = CheckPlugin(
+    name="storagegrid_s3_site",
+    service_name="StorageGRID S3 Site %s",
+    discovery_function=discover_storagegrid_s3_site,
+    check_function=check_storagegrid_s3_site,
+    check_default_parameters={
+        'error_rate_levels': ("fixed", (1.0, 5.0)),
+    },
+    check_ruleset_name="storagegrid_s3_traffic",
+    sections=["storagegrid_s3_nodes"],
+)
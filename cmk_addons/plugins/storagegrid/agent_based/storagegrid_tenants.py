@@ -5,6 +5,7 @@ CheckMK 2.4.0 API (agent_based v2)
 """
 
 import json
+import time
 
 from cmk.agent_based.v2 import (
     AgentSection,
@@ -19,17 +20,28 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.storagegrid.lib.stale import check_stale_data
+
 
 def parse_storagegrid_tenant_usage(string_table: StringTable) -> dict | None:
-    """Parse tenant usage data"""
+    """Parse tenant usage data, indexing tenants by account name"""
     if not string_table:
         return None
 
     try:
-        return json.loads(string_table[0][0])
+        section = json.loads(string_table[0][0])
     except (IndexError, json.JSONDecodeError, ValueError):
         return None
 
+    tenants_by_name = {}
+    for tenant in section.get('tenants', []):
+        tenant_name = tenant.get('account_name')
+        if tenant_name:
+            tenants_by_name.setdefault(tenant_name, tenant)
+
+    section['tenants_by_name'] = tenants_by_name
+    return section
+
 
 def discover_storagegrid_tenant_usage(section: dict) -> DiscoveryResult:
     """Discover tenant usage services"""
@@ -52,56 +64,61 @@ def check_storagegrid_tenant_usage(item: str, params: dict, section: dict) -> Ch
         yield Result(state=State.UNKNOWN, summary=f"Error: {section['error']}")
         return
 
-    for tenant in section.get('tenants', []):
-        if tenant.get('account_name') != item:
-            continue
-
-        data_bytes = tenant.get('data_bytes', 0)
-        quota_bytes = tenant.get('quota_bytes', 0)
-        quota_percent = tenant.get('quota_percent', 0)
-        object_count = tenant.get('object_count', 0)
-
-        yield Metric(name="data_bytes", value=data_bytes, boundaries=(0, quota_bytes) if quota_bytes > 0 else None)
-        yield Metric(name="object_count", value=object_count)
-
-        if quota_bytes > 0:
-            # Get thresholds
-            warn, crit = params.get('quota_levels', (80.0, 90.0))
-
-            # Determine state
-            if quota_percent >= crit:
-                state = State.CRIT
-            elif quota_percent >= warn:
-                state = State.WARN
-            else:
-                state = State.OK
-
-            # Build summary with size and object count
-            summary = (
-                f"Quota usage: {quota_percent:.2f}%, "
-                f"Used: {render.bytes(data_bytes)} / {render.bytes(quota_bytes)}, "
-                f"{object_count:,} objects"
-            )
-            if state != State.OK:
-                summary += f" (warn/crit at {warn:.1f}%/{crit:.1f}%)"
-
-            yield Result(state=state, summary=summary)
-
-            yield Metric(
-                name="quota_utilization",
-                value=quota_percent,
-                levels=(warn, crit),
-                boundaries=(0, 100)
-            )
-        else:
-            yield Result(
-                state=State.OK,
-                summary=f"Used: {render.bytes(data_bytes)}, {object_count:,} objects (no quota set)"
-            )
+    yield from check_stale_data(section)
 
+    tenant = section.get('tenants_by_name', {}).get(item)
+    if tenant is None:
+        yield Result(state=State.UNKNOWN, summary=f"Tenant {item} not found in usage data")
         return
 
-    yield Result(state=State.UNKNOWN, summary=f"Tenant {item} not found in usage data")
+    data_bytes = tenant.get('data_bytes', 0)
+    quota_bytes = tenant.get('quota_bytes', 0)
+    quota_percent = tenant.get('quota_percent', 0)
+    object_count = tenant.get('object_count', 0)
+
+    yield Metric(name="data_bytes", value=data_bytes, boundaries=(0, quota_bytes) if quota_bytes > 0 else None)
+    yield Metric(name="object_count", value=object_count)
+
+    if quota_bytes > 0:
+        # Get thresholds
+        warn, crit = params.get('quota_levels', (80.0, 90.0))
+
+        # Determine state
+        if quota_percent >= crit:
+            state = State.CRIT
+        elif quota_percent >= warn:
+            state = State.WARN
+        else:
+            state = State.OK
+
+        # Build summary with size and object count
+        summary = (
+            f"Quota usage: {quota_percent:.2f}%, "
+            f"Used: {render.bytes(data_bytes)} / {render.bytes(quota_bytes)}, "
+            f"{object_count:,} objects"
+        )
+        if state != State.OK:
+            summary += f" (warn/crit at {warn:.1f}%/{crit:.1f}%)"
+
+        yield Result(state=state, summary=summary)
+
+        yield Metric(
+            name="quota_utilization",
+            value=quota_percent,
+            levels=(warn, crit),
+            boundaries=(0, 100)
+        )
+    else:
+        yield Result(
+            state=State.OK,
+            summary=f"Used: {render.bytes(data_bytes)}, {object_count:,} objects (no quota set)"
+        )
+
+    # Only sent by agents refreshing per-tenant usage in rotating shards (--tenant-refresh-shards)
+    collected_at = tenant.get('collected_at')
+    if collected_at is not None:
+        age = max(0.0, time.time() - collected_at)
+        yield Result(state=State.OK, notice=f"Usage collected {render.timespan(age)} ago")
 
 
 agent_section_storagegrid_tenant_usage = AgentSection(
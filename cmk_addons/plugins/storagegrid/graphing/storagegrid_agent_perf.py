@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+CheckMK Graph Templates for StorageGRID Special Agent Performance
+"""
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import (
+    Color,
+    DecimalNotation,
+    IECNotation,
+    Metric,
+    StrictPrecision,
+    TimeNotation,
+    Unit,
+)
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+
+metric_storagegrid_agent_runtime = Metric(
+    name="storagegrid_agent_runtime",
+    title=Title("Agent run time"),
+    unit=Unit(TimeNotation()),
+    color=Color.BLUE,
+)
+
+metric_storagegrid_agent_requests = Metric(
+    name="storagegrid_agent_requests",
+    title=Title("API requests per run"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.GREEN,
+)
+
+metric_storagegrid_agent_response_bytes = Metric(
+    name="storagegrid_agent_response_bytes",
+    title=Title("API response size per run"),
+    unit=Unit(IECNotation("B")),
+    color=Color.PURPLE,
+)
+
+metric_storagegrid_agent_wire_bytes = Metric(
+    name="storagegrid_agent_wire_bytes",
+    title=Title("API bytes transferred per run"),
+    unit=Unit(IECNotation("B")),
+    color=Color.DARK_PURPLE,
+)
+
+metric_storagegrid_agent_retries = Metric(
+    name="storagegrid_agent_retries",
+    title=Title("Retried API requests"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.RED,
+)
+
+metric_storagegrid_agent_retry_seconds = Metric(
+    name="storagegrid_agent_retry_seconds",
+    title=Title("Time spent waiting for retries"),
+    unit=Unit(TimeNotation()),
+    color=Color.PINK,
+)
+
+metric_storagegrid_agent_connections = Metric(
+    name="storagegrid_agent_connections",
+    title=Title("HTTP connections opened"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.ORANGE,
+)
+
+metric_storagegrid_section_cache_hit_ratio = Metric(
+    name="storagegrid_section_cache_hit_ratio",
+    title=Title("Section cache hit ratio"),
+    unit=Unit(DecimalNotation("%"), StrictPrecision(1)),
+    color=Color.CYAN,
+)
+
+metric_storagegrid_collector_health_seconds = Metric(
+    name="storagegrid_collector_health_seconds",
+    title=Title("Collection time: health"),
+    unit=Unit(TimeNotation()),
+    color=Color.GREEN,
+)
+
+metric_storagegrid_collector_alerts_seconds = Metric(
+    name="storagegrid_collector_alerts_seconds",
+    title=Title("Collection time: alerts"),
+    unit=Unit(TimeNotation()),
+    color=Color.RED,
+)
+
+metric_storagegrid_collector_capacity_seconds = Metric(
+    name="storagegrid_collector_capacity_seconds",
+    title=Title("Collection time: capacity"),
+    unit=Unit(TimeNotation()),
+    color=Color.BLUE,
+)
+
+metric_storagegrid_collector_s3_performance_seconds = Metric(
+    name="storagegrid_collector_s3_performance_seconds",
+    title=Title("Collection time: S3 performance"),
+    unit=Unit(TimeNotation()),
+    color=Color.ORANGE,
+)
+
+metric_storagegrid_collector_s3_nodes_seconds = Metric(
+    name="storagegrid_collector_s3_nodes_seconds",
+    title=Title("Collection time: S3 per node and site"),
+    unit=Unit(TimeNotation()),
+    color=Color.LIGHT_ORANGE,
+)
+
+metric_storagegrid_collector_resources_seconds = Metric(
+    name="storagegrid_collector_resources_seconds",
+    title=Title("Collection time: node resources"),
+    unit=Unit(TimeNotation()),
+    color=Color.PURPLE,
+)
+
+metric_storagegrid_collector_tenant_usage_seconds = Metric(
+    name="storagegrid_collector_tenant_usage_seconds",
+    title=Title("Collection time: tenant usage"),
+    unit=Unit(TimeNotation()),
+    color=Color.YELLOW,
+)
+
+metric_storagegrid_collector_ilm_seconds = Metric(
+    name="storagegrid_collector_ilm_seconds",
+    title=Title("Collection time: ILM"),
+    unit=Unit(TimeNotation()),
+    color=Color.BROWN,
+)
+
+graph_storagegrid_agent_runtime = Graph(
+    name="storagegrid_agent_runtime",
+    title=Title("StorageGRID agent run time"),
+    simple_lines=["storagegrid_agent_runtime"],
+    minimal_range=MinimalRange(0, 60),
+)
+
+graph_storagegrid_agent_retry_seconds = Graph(
+    name="storagegrid_agent_retry_seconds",
+    title=Title("StorageGRID agent retry wait time"),
+    compound_lines=["storagegrid_agent_retry_seconds"],
+)
+
+graph_storagegrid_collector_times = Graph(
+    name="storagegrid_collector_times",
+    title=Title("StorageGRID collection time per section"),
+    simple_lines=[
+        "storagegrid_collector_health_seconds",
+        "storagegrid_collector_alerts_seconds",
+        "storagegrid_collector_capacity_seconds",
+        "storagegrid_collector_s3_performance_seconds",
+        "storagegrid_collector_s3_nodes_seconds",
+        "storagegrid_collector_resources_seconds",
+        "storagegrid_collector_tenant_usage_seconds",
+        "storagegrid_collector_ilm_seconds",
+    ],
+)
+
+graph_storagegrid_agent_requests = Graph(
+    name="storagegrid_agent_requests",
+    title=Title("StorageGRID agent API requests"),
+    simple_lines=[
+        "storagegrid_agent_requests",
+        "storagegrid_agent_connections",
+        "storagegrid_agent_retries",
+    ],
+)
+
+graph_storagegrid_agent_response_bytes = Graph(
+    name="storagegrid_agent_response_bytes",
+    title=Title("StorageGRID agent API response size"),
+    compound_lines=["storagegrid_agent_response_bytes"],
+    simple_lines=["storagegrid_agent_wire_bytes"],
+)
+
+graph_storagegrid_section_cache_hit_ratio = Graph(
+    name="storagegrid_section_cache_hit_ratio",
+    title=Title("StorageGRID section cache hit ratio"),
+    compound_lines=["storagegrid_section_cache_hit_ratio"],
+    minimal_range=MinimalRange(0, 100),
+)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+CheckMK Graph Templates for StorageGRID S3 Node Traffic
+"""
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import (
+    Color,
+    IECNotation,
+    Metric,
+    Unit,
+)
+from cmk.graphing.v1.graphs import Graph
+
+metric_s3_bytes_in_rate = Metric(
+    name="s3_bytes_in_rate",
+    title=Title("S3 ingest throughput"),
+    unit=Unit(IECNotation("B/s")),
+    color=Color.GREEN,
+)
+
+metric_s3_bytes_out_rate = Metric(
+    name="s3_bytes_out_rate",
+    title=Title("S3 retrieval throughput"),
+    unit=Unit(IECNotation("B/s")),
+    color=Color.BLUE,
+)
+
+graph_storagegrid_s3_throughput = Graph(
+    name="storagegrid_s3_throughput",
+    title=Title("S3 throughput"),
+    simple_lines=[
+        "s3_bytes_in_rate",
+        "s3_bytes_out_rate",
+    ],
+)
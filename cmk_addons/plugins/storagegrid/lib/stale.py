@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for StorageGRID check plugins: stale section data
+CheckMK 2.4.0 API (agent_based v2)
+"""
+
+import time
+
+from cmk.agent_based.v2 import (
+    Result,
+    State,
+    render,
+    CheckResult,
+)
+
+
+def check_stale_data(section: dict) -> CheckResult:
+    """Report section data the agent re-sent from an earlier run
+
+    The agent adds a 'stale' entry when collecting a section failed and it
+    sent the last successfully collected data instead. Nothing is yielded for
+    freshly collected data. Stale data is OK up to the maximum staleness
+    configured for the agent, and UNKNOWN once it is older than that.
+    """
+    stale = section.get('stale')
+    if not stale:
+        return
+
+    age = max(0.0, time.time() - stale.get('collected_at', 0))
+    max_stale = stale.get('max_stale', 0)
+    error = stale.get('error', "unknown error")
+    if max_stale and age > max_stale:
+        yield Result(
+            state=State.UNKNOWN,
+            summary=(
+                f"Stale data: last collected {render.timespan(age)} ago, "
+                f"older than the limit of {render.timespan(max_stale)}"
+            ),
+            details=f"Collection failed: {error}"
+        )
+    else:
+        yield Result(
+            state=State.OK,
+            summary=f"Data from {render.timespan(age)} ago, current collection failed",
+            details=f"Collection failed: {error}"
+        )
@@ -12,8 +12,10 @@ from cmk.rulesets.v1.form_specs import (
     LevelDirection,
     Percentage,
     DefaultValue,
+    TimeSpan,
+    TimeMagnitude,
 )
-from cmk.rulesets.v1.rule_specs import CheckParameters, Topic, HostCondition
+from cmk.rulesets.v1.rule_specs import CheckParameters, Topic, HostCondition, HostAndItemCondition
 
 
 def _formspec_s3_performance():
@@ -51,3 +53,73 @@ rule_spec_storagegrid_s3_performance = CheckParameters(
     parameter_form=_formspec_s3_performance,
     condition=HostCondition(),
 )
+
+
+def _formspec_s3_traffic():
+    return Dictionary(
+        title=Title("StorageGRID S3 Node and Site Traffic"),
+        help_text=Help(
+            "Configure warning and critical thresholds for the S3 error rate of a "
+            "single StorageGRID node or site. The error rate is the percentage of "
+            "failed S3 requests out of all S3 requests handled by that node or by "
+            "the nodes of that site."
+        ),
+        elements={
+            "error_rate_levels": DictElement(
+                required=False,
+                parameter_form=SimpleLevels(
+                    title=Title("S3 Error Rate"),
+                    level_direction=LevelDirection.UPPER,
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue((1.0, 5.0)),
+                ),
+            ),
+        },
+    )
+
+
+rule_spec_storagegrid_s3_traffic = CheckParameters(
+    name="storagegrid_s3_traffic",
+    title=Title("StorageGRID S3 Node and Site Traffic"),
+    topic=Topic.STORAGE,
+    parameter_form=_formspec_s3_traffic,
+    condition=HostAndItemCondition(item_title=Title("Node or site name")),
+)
+
+
+def _formspec_agent_perf():
+    return Dictionary(
+        title=Title("StorageGRID Agent Performance"),
+        help_text=Help(
+            "Configure thresholds for the run time of the StorageGRID special agent. "
+            "Set them below the check interval of the host, so that you are warned "
+            "before a slow grid makes the agent miss its interval."
+        ),
+        elements={
+            "runtime_levels": DictElement(
+                required=False,
+                parameter_form=SimpleLevels(
+                    title=Title("Agent Run Time"),
+                    help_text=Help(
+                        "Total wall time of one agent run, from start to the last "
+                        "section written. The defaults suit the standard one minute "
+                        "check interval."
+                    ),
+                    level_direction=LevelDirection.UPPER,
+                    form_spec_template=TimeSpan(
+                        displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MILLISECOND]
+                    ),
+                    prefill_fixed_levels=DefaultValue((45.0, 55.0)),
+                ),
+            ),
+        },
+    )
+
+
+rule_spec_storagegrid_agent_perf = CheckParameters(
+    name="storagegrid_agent_perf",
+    title=Title("StorageGRID Agent Performance"),
+    topic=Topic.STORAGE,
+    parameter_form=_formspec_agent_perf,
+    condition=HostCondition(),
+)
@@ -4,7 +4,7 @@ GUI Configuration for StorageGRID Special Agent
 CheckMK 2.4.0 API
 """
 
-from cmk.rulesets.v1 import Title, Help
+from cmk.rulesets.v1 import Title, Help, Label
 from cmk.rulesets.v1.form_specs import (
     Dictionary,
     DictElement,
@@ -13,11 +13,42 @@ from cmk.rulesets.v1.form_specs import (
     Integer,
     BooleanChoice,
     DefaultValue,
+    List,
+    MultipleChoice,
+    MultipleChoiceElement,
     migrate_to_password,
 )
 from cmk.rulesets.v1.rule_specs import SpecialAgent, Topic
 
 
+# Section name, title and suggested cache interval in seconds, in agent output order
+_CACHEABLE_SECTIONS = [
+    ("health", Title("Node and site health"), 60),
+    ("alerts", Title("Alerts"), 60),
+    ("capacity", Title("Storage capacity"), 300),
+    ("s3_performance", Title("S3 performance"), 60),
+    ("s3_nodes", Title("S3 traffic per node and site"), 60),
+    ("resources", Title("Node resources"), 60),
+    ("tenant_usage", Title("Tenant usage"), 900),
+    ("ilm", Title("ILM"), 600),
+]
+
+
+def _cache_interval_element(title, default):
+    return DictElement(
+        required=False,
+        parameter_form=Integer(
+            title=title,
+            prefill=DefaultValue(default),
+            custom_validate=(
+                lambda v: None if 0 <= v <= 86400
+                else ValueError("Cache interval must be between 0 and 86400 seconds")
+            ),
+            unit_symbol="seconds",
+        ),
+    )
+
+
 def _formspec():
     return Dictionary(
         title=Title("NetApp StorageGRID"),
@@ -43,6 +74,37 @@ def _formspec():
                     migrate=migrate_to_password,
                 ),
             ),
+            "admin_nodes": DictElement(
+                required=False,
+                parameter_form=List(
+                    title=Title("Additional admin nodes"),
+                    help_text=Help(
+                        "Further admin nodes of the grid, as host name or IP address with an "
+                        "optional port. The agent times a short request to every admin node, "
+                        "including the host's own address, and sends its queries to the fastest "
+                        "one that responds. If an admin node stops responding during a run, the "
+                        "remaining requests go to the next one."
+                    ),
+                    element_template=String(title=Title("Admin node")),
+                    add_element_label=Label("Add admin node"),
+                ),
+            ),
+            "admin_node_spread": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Spread sections over admin nodes"),
+                    help_text=Help(
+                        "Distribute the sections over this many of the fastest admin nodes, so "
+                        "that no single admin node serves all queries. Each section is collected "
+                        "from one admin node. 1 sends all queries to the fastest admin node."
+                    ),
+                    prefill=DefaultValue(1),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 10
+                        else ValueError("Spread must be between 1 and 10 admin nodes")
+                    ),
+                ),
+            ),
             "no_cert_check": DictElement(
                 required=False,
                 parameter_form=BooleanChoice(
@@ -54,6 +116,18 @@ def _formspec():
                     prefill=DefaultValue(False),
                 ),
             ),
+            "no_token_cache": DictElement(
+                required=False,
+                parameter_form=BooleanChoice(
+                    title=Title("Disable API token caching"),
+                    help_text=Help(
+                        "By default the agent keeps its bearer token on disk (readable only by "
+                        "the site user) and reuses it across runs, re-authenticating only when "
+                        "the API rejects it. Enable this to authenticate on every run instead."
+                    ),
+                    prefill=DefaultValue(False),
+                ),
+            ),
             "timeout": DictElement(
                 required=False,
                 parameter_form=Integer(
@@ -67,6 +141,238 @@ def _formspec():
                     unit_symbol="seconds",
                 ),
             ),
+            "retries": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Retries of failed API requests"),
+                    help_text=Help(
+                        "How often a read request is retried after a connection error or "
+                        "HTTP 429, 502, 503 or 504, and after a timeout if enabled below. "
+                        "Waits between retries grow "
+                        "exponentially with random jitter, and a Retry-After header from the "
+                        "admin node is honoured. No retry is started that would run past the "
+                        "run deadline. 0 disables retries."
+                    ),
+                    prefill=DefaultValue(2),
+                    custom_validate=(
+                        lambda v: None if 0 <= v <= 10
+                        else ValueError("Retries must be between 0 and 10")
+                    ),
+                ),
+            ),
+            "retry_timeouts": DictElement(
+                required=False,
+                parameter_form=BooleanChoice(
+                    title=Title("Retry timed out requests"),
+                    help_text=Help(
+                        "By default a request that times out is not retried, because every "
+                        "attempt can take the full request timeout. With the default timeout "
+                        "of 30 seconds, two retries of one hung request already exceed the "
+                        "60 second timeout CheckMK gives special agents. If you enable this, "
+                        "also set a run deadline below that timeout."
+                    ),
+                    prefill=DefaultValue(False),
+                ),
+            ),
+            "retry_max_delay": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Maximum wait before a retry"),
+                    help_text=Help(
+                        "Longest time the agent waits before retrying a request. A request "
+                        "whose Retry-After header asks for a longer wait is not retried."
+                    ),
+                    prefill=DefaultValue(10),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 300
+                        else ValueError("Maximum wait must be between 1 and 300 seconds")
+                    ),
+                    unit_symbol="seconds",
+                ),
+            ),
+            "deadline": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Run deadline"),
+                    help_text=Help(
+                        "Time budget for a whole agent run. Health and alerts are started "
+                        "first, and all sections share the budget. Sections not "
+                        "collected in time are reported with a timeout error, while all other "
+                        "sections are still delivered. Keep this below the special agent "
+                        "timeout of CheckMK, so that a slow grid does not lose every section. "
+                        "0 disables the deadline."
+                    ),
+                    prefill=DefaultValue(50),
+                    custom_validate=(
+                        lambda v: None if 0 <= v <= 3600
+                        else ValueError("Run deadline must be between 0 and 3600 seconds")
+                    ),
+                    unit_symbol="seconds",
+                ),
+            ),
+            "breaker_threshold": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Circuit breaker threshold"),
+                    help_text=Help(
+                        "Number of consecutive timeouts or connection errors after which the agent "
+                        "stops sending requests to the admin node. Further requests fail "
+                        "immediately, also in the following runs, until a single probe request "
+                        "after 60 seconds succeeds. An outage then costs one timeout per run "
+                        "instead of one per request. 0 disables the circuit breaker."
+                    ),
+                    prefill=DefaultValue(3),
+                    custom_validate=(
+                        lambda v: None if 0 <= v <= 100
+                        else ValueError("Threshold must be between 0 and 100")
+                    ),
+                ),
+            ),
+            "max_stale": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Serve last good data on failure"),
+                    help_text=Help(
+                        "If collecting a section fails, for example because the admin node is "
+                        "briefly unreachable, send the last successfully collected data of that "
+                        "section instead, as long as it is at most this old. Services keep their "
+                        "last known state and show the age of their data instead of all going "
+                        "UNKNOWN at once. Once the data is older than this, the services go "
+                        "UNKNOWN. 0 disables the fallback."
+                    ),
+                    prefill=DefaultValue(900),
+                    custom_validate=(
+                        lambda v: None if 0 <= v <= 86400
+                        else ValueError("Maximum staleness must be between 0 and 86400 seconds")
+                    ),
+                    unit_symbol="seconds",
+                ),
+            ),
+            "from_daemon": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Read sections from collector daemon"),
+                    help_text=Help(
+                        "Do not query the grid from the special agent. Instead, print the sections "
+                        "that a collector daemon (agent_storagegrid --daemon, running as the site "
+                        "user with the same host address) wrote to the local cache, as long as "
+                        "they are at most this old. The agent then finishes in well under a "
+                        "second, however large the grid is. Sections the daemon has not written "
+                        "in this time are reported with an error."
+                    ),
+                    prefill=DefaultValue(300),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 86400
+                        else ValueError("Maximum age must be between 1 and 86400 seconds")
+                    ),
+                    unit_symbol="seconds",
+                ),
+            ),
+            "max_workers": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Maximum parallel API requests"),
+                    help_text=Help(
+                        "Number of API requests the agent may have in flight at the same "
+                        "time. Independent sections and their metric queries are collected "
+                        "in parallel up to this limit. Set to 1 to collect sequentially."
+                    ),
+                    prefill=DefaultValue(4),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 32
+                        else ValueError("Parallel requests must be between 1 and 32")
+                    ),
+                ),
+            ),
+            "pool_size": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Connection pool size"),
+                    help_text=Help(
+                        "Maximum number of keep-alive HTTPS connections the agent holds open "
+                        "to the admin node. Connections are reused across all API calls of a "
+                        "run, so TCP and TLS handshakes are paid once per connection instead "
+                        "of once per request. Defaults to the number of parallel API requests."
+                    ),
+                    prefill=DefaultValue(4),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 32
+                        else ValueError("Pool size must be between 1 and 32")
+                    ),
+                ),
+            ),
+            "tenant_refresh_shards": DictElement(
+                required=False,
+                parameter_form=Integer(
+                    title=Title("Refresh per-tenant usage in shards"),
+                    help_text=Help(
+                        "For tenants the tenant usage metrics do not cover, the agent calls the "
+                        "usage endpoint of each tenant. With a value above 1, the tenants are "
+                        "split into this many shards and each run refreshes one of them in turn, "
+                        "reporting the last collected usage for the others. Tenants at 80% of "
+                        "their quota or more are refreshed on every run. Each tenant service "
+                        "shows when its usage was collected."
+                    ),
+                    prefill=DefaultValue(4),
+                    custom_validate=(
+                        lambda v: None if 1 <= v <= 100
+                        else ValueError("Shards must be between 1 and 100")
+                    ),
+                ),
+            ),
+            "s3_counters": DictElement(
+                required=False,
+                parameter_form=BooleanChoice(
+                    title=Title("Compute S3 rates from counters"),
+                    help_text=Help(
+                        "By default the agent asks Prometheus for the S3 request rates over the "
+                        "last 5 minutes. Enable this to fetch the cumulative request counters of "
+                        "each node instead, which is a cheaper query, and let the S3 Performance "
+                        "service compute the rates over the time between two checks. A node "
+                        "whose counters were reset, for example by a restart, is left out for one "
+                        "check interval. The service shows no rates on its first check."
+                    ),
+                    prefill=DefaultValue(False),
+                ),
+            ),
+            "sections": DictElement(
+                required=False,
+                parameter_form=MultipleChoice(
+                    title=Title("Sections to collect"),
+                    help_text=Help(
+                        "Collect only the selected sections. The agent sends no API requests "
+                        "for the others and does not output them, so their services are not "
+                        "discovered. If this option is not set, all sections are collected."
+                    ),
+                    elements=[
+                        MultipleChoiceElement(name=name, title=title)
+                        for name, title, _ in _CACHEABLE_SECTIONS
+                    ],
+                    show_toggle_all=True,
+                    prefill=DefaultValue([name for name, _, _ in _CACHEABLE_SECTIONS]),
+                    custom_validate=(
+                        lambda v: None if v
+                        else ValueError("Select at least one section")
+                    ),
+                ),
+            ),
+            "cache_intervals": DictElement(
+                required=False,
+                parameter_form=Dictionary(
+                    title=Title("Section cache intervals"),
+                    help_text=Help(
+                        "Collect the selected sections only once per interval and serve them "
+                        "from an on-disk cache in between. Cached sections are sent to CheckMK "
+                        "with their real age, so services show when the data was collected. "
+                        "Use this for data that changes slowly, such as tenant usage and ILM. "
+                        "Sections that are not selected are collected on every run."
+                    ),
+                    elements={
+                        name: _cache_interval_element(title, default)
+                        for name, title, default in _CACHEABLE_SECTIONS
+                    },
+                ),
+            ),
         },
     )
 
@@ -21,8 +21,24 @@ class Params(BaseModel):
     """Parameters for StorageGRID special agent"""
     username: str
     password: Secret
+    admin_nodes: list[str] | None = None
+    admin_node_spread: int | None = None
     no_cert_check: bool | None = None
+    no_token_cache: bool | None = None
     timeout: int | None = None
+    deadline: int | None = None
+    retries: int | None = None
+    retry_timeouts: bool | None = None
+    retry_max_delay: int | None = None
+    breaker_threshold: int | None = None
+    max_stale: int | None = None
+    from_daemon: int | None = None
+    max_workers: int | None = None
+    pool_size: int | None = None
+    tenant_refresh_shards: int | None = None
+    s3_counters: bool | None = None
+    sections: list[str] | None = None
+    cache_intervals: dict[str, int] | None = None
 
 
 def _agent_storagegrid_arguments(
@@ -37,6 +53,12 @@ def _agent_storagegrid_arguments(
     hostname = host_config.primary_ip_config.address or host_config.name
     args.extend(["--hostname", hostname])
 
+    # Further admin nodes
+    for admin_node in params.admin_nodes or []:
+        args.extend(["--admin-node", admin_node])
+    if params.admin_node_spread is not None:
+        args.extend(["--admin-node-spread", str(params.admin_node_spread)])
+
     # Username
     args.extend(["--username", params.username])
 
@@ -47,10 +69,62 @@ def _agent_storagegrid_arguments(
     if params.no_cert_check:
         args.append("--no-cert-check")
 
+    # Token caching
+    if params.no_token_cache:
+        args.append("--no-token-cache")
+
     # Timeout
     if params.timeout is not None:
         args.extend(["--timeout", str(params.timeout)])
 
+    # Retry policy
+    if params.retries is not None:
+        args.extend(["--retries", str(params.retries)])
+    if params.retry_timeouts:
+        args.append("--retry-timeouts")
+    if params.retry_max_delay is not None:
+        args.extend(["--retry-max-delay", str(params.retry_max_delay)])
+
+    # Whole-run deadline
+    if params.deadline is not None:
+        args.extend(["--deadline", str(params.deadline)])
+
+    # Circuit breaker
+    if params.breaker_threshold is not None:
+        args.extend(["--breaker-threshold", str(params.breaker_threshold)])
+
+    # Last good data on failure
+    if params.max_stale is not None:
+        args.extend(["--max-stale", str(params.max_stale)])
+
+    # Collector daemon
+    if params.from_daemon is not None:
+        args.extend(["--from-daemon", str(params.from_daemon)])
+
+    # Concurrency
+    if params.max_workers is not None:
+        args.extend(["--max-workers", str(params.max_workers)])
+
+    # Connection pool
+    if params.pool_size is not None:
+        args.extend(["--pool-size", str(params.pool_size)])
+
+    # Per-tenant usage refresh
+    if params.tenant_refresh_shards is not None:
+        args.extend(["--tenant-refresh-shards", str(params.tenant_refresh_shards)])
+
+    # S3 rates from counters
+    if params.s3_counters:
+        args.append("--s3-counters")
+
+    # Section selection
+    if params.sections:
+        args.extend(["--sections", ",".join(params.sections)])
+
+    # Per-section cache intervals
+    for section_name, interval in sorted((params.cache_intervals or {}).items()):
+        args.extend(["--cache-interval", f"{section_name}={interval}"])
+
     yield SpecialAgentCommand(command_arguments=args)
 
 